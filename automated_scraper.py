@@ -5,8 +5,11 @@ Automatically finds items with both digital coupons AND sales
 Sends email notifications when great deals are found
 """
 
-import requests
-import json
+import asyncio
+import hashlib
+import httpx
+import orjson
+import os
 import time
 import smtplib
 import schedule
@@ -18,17 +21,210 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import logging
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import re
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Responses worth retrying with backoff before giving up on a request
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Deals already found within this window are not reported again
+_DUPLICATE_WINDOW = timedelta(days=3)
+
+# Patterns used for every scraped card
+_PRICE_RE = re.compile(r'\$?(\d+\.?\d*)')
+_SIZE_RE = re.compile(r'\b\d+(?:\.\d+)?\s*(?:oz|lb|ct|fl\s*oz|ml|l)\b')
+
+# Selector candidates for each card field, in priority order
+_COUPON_CARD_SELECTOR = "[data-testid='coupon-card'], .coupon-card, .coupon-item"
+_COUPON_FIELDS = {
+    'product_name': ['.product-name', '.coupon-title', 'h3', 'h4', '[data-testid="product-name"]'],
+    'discount': ['.discount-amount', '.coupon-value', '.savings', '[data-testid="discount"]'],
+    'expiry_date': ['.expiry-date', '.expires', '.valid-until'],
+    'description': ['.coupon-description', '.qualifying-products', '.details']
+}
+_SALE_CARD_SELECTOR = "[data-testid='sale-item'], .sale-item, .product-card"
+_SALE_FIELDS = {
+    'product_name': ['.product-name', '.item-name', 'h3', 'h4', '[data-testid="product-name"]'],
+    'sale_price': ['.sale-price', '.current-price', '.price-now', '[data-testid="sale-price"]'],
+    'original_price': ['.original-price', '.was-price', '.price-was', '[data-testid="original-price"]'],
+    'sale_description': ['.sale-description', '.promo-text', '.deal-text']
+}
+
+# Collects the non-empty text of every selector candidate for every card in a
+# single WebDriver call: arguments are (card selector, {field: [selectors]})
+_EXTRACT_CARDS_JS = """
+const [cardSelector, fields] = arguments;
+return Array.from(document.querySelectorAll(cardSelector), card => {
+    const record = {};
+    for (const [field, selectors] of Object.entries(fields)) {
+        record[field] = selectors
+            .map(selector => card.querySelector(selector))
+            .map(el => el ? el.innerText.trim() : '')
+            .filter(text => text);
+    }
+    return record;
+});
+"""
+
+# Email templates: static blocks are rendered once, per-call values filled with str.format
+_HTML_HEADER_TMPL = """
+        <html>
+        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+            <h1 style="color: #e31837;">🛍️ Giant Food Double-Savings Alert!</h1>
+            <p style="font-size: 18px; color: #333;">
+                Found <strong>{count} deals</strong> with both sales AND digital coupons!<br>
+                💰 Total potential savings: <strong>${total_savings:.2f}</strong>
+            </p>
+            
+            <div style="background: #f5f5f5; padding: 15px; border-radius: 8px; margin: 20px 0;">
+                <p style="margin: 0; font-size: 14px; color: #666;">
+                    ✅ These items are on sale AND have digital coupons<br>
+                    📱 Make sure to clip the coupons in your Giant Food app<br>
+                    ⏰ Check expiration dates before shopping
+                </p>
+            </div>
+        """
+
+_HTML_DEAL_TMPL = """
+            <div style="border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 8px;">
+                <h3 style="color: #e31837; margin: 0 0 10px 0;">{i}. {deal.product_name}</h3>
+                <div style="display: flex; justify-content: space-between; margin: 10px 0;">
+                    <div>
+                        <p style="margin: 5px 0;"><strong>Was:</strong> ${deal.original_price:.2f}</p>
+                        <p style="margin: 5px 0;"><strong>Sale:</strong> ${deal.sale_price:.2f}</p>
+                        <p style="margin: 5px 0;"><strong>After Coupon:</strong> ${deal.final_price:.2f}</p>
+                    </div>
+                    <div style="text-align: right;">
+                        <p style="margin: 5px 0; font-size: 18px; color: #28a745;">
+                            <strong>💰 Save ${deal.savings:.2f}</strong>
+                        </p>
+                        <p style="margin: 5px 0; color: #28a745;">
+                            ({deal.savings_percent:.0f}% off!)
+                        </p>
+                    </div>
+                </div>
+                <p style="margin: 5px 0; font-size: 12px; color: #666;">
+                    🎫 Coupon: {deal.coupon_description}<br>
+                    🏷️ Sale: {deal.sale_description}
+                </p>
+            </div>
+            """
+
+_HTML_TIPS = """
+            <div style="background: #e8f5e8; padding: 15px; border-radius: 8px; margin: 20px 0;">
+                <h3 style="color: #28a745; margin: 0 0 10px 0;">📝 Shopping Tips:</h3>
+                <ul style="margin: 0; padding-left: 20px;">
+                    <li>Open your Giant Food app and "clip" the digital coupons</li>
+                    <li>Use your loyalty card when checking out</li>
+                    <li>Check expiration dates on both sales and coupons</li>
+                    <li>Shop early in the week for best selection</li>
+                </ul>
+            </div>
+            """
+
+_HTML_FOOTER_TMPL = """
+            <p style="text-align: center; color: #666; font-size: 12px; margin-top: 30px;">
+                Generated by Giant Food Deal Tracker<br>
+                {timestamp}
+            </p>
+        </body>
+        </html>
+        """
+
+_TEXT_HEADER_TMPL = """🛍️ Giant Food Double-Savings Alert!
+
+Found {count} deals with both sales AND digital coupons!
+💰 Total potential savings: ${total_savings:.2f}
+
+✅ These items are on sale AND have digital coupons
+📱 Make sure to clip the coupons in your Giant Food app
+⏰ Check expiration dates before shopping
+
+DEALS FOUND:
+============
+"""
+
+_TEXT_DEAL_TMPL = """
+{i}. {deal.product_name}
+   Was: ${deal.original_price:.2f} → Sale: ${deal.sale_price:.2f} → Final: ${deal.final_price:.2f}
+   💰 YOU SAVE: ${deal.savings:.2f} ({deal.savings_percent:.0f}% off!)
+   🎫 Coupon: {deal.coupon_description}
+   🏷️ Sale: {deal.sale_description}
+   --------------------------------------------------"""
+
+_TEXT_FOOTER_TMPL = """
+
+📝 Shopping Tips:
+• Open your Giant Food app and "clip" the digital coupons
+• Use your loyalty card when checking out
+• Check expiration dates on both sales and coupons
+• Shop early in the week for best selection
+
+Generated by Giant Food Deal Tracker - {timestamp}
+"""
+
+@lru_cache(maxsize=8)
+def _read_file(path: str, mtime: float) -> bytes:
+    """Read a file's bytes, cached on (path, mtime) so unchanged files are not reread"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _load_json(path: str) -> Dict:
+    """Parse a JSON file from cached bytes, returning a fresh object each call"""
+    return orjson.loads(_read_file(path, os.path.getmtime(path)))
+
+def _read_lines_reversed(path: str, block_size: int = 65536):
+    """Yield the lines of a file from last to first, reading blocks from the end"""
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b'\n')
+            remainder = lines.pop(0)
+            yield from reversed(lines)
+        yield remainder
+
+def _signature(product_name: str, final_price: float) -> bytes:
+    """Identify a deal for duplicate detection with a compact 16-byte hash"""
+    return hashlib.blake2b(f"{product_name}_{final_price}".encode(), digest_size=16).digest()
+
+class _RateLimiter:
+    """Async token bucket allowing `rate` requests every `per` seconds"""
+    
+    def __init__(self, rate: float, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+@dataclass(slots=True, frozen=True)
 class Deal:
     product_name: str
     original_price: float
@@ -46,16 +242,22 @@ class Deal:
 class GiantFoodAutomatedScraper:
     def __init__(self, config_file: str = "scraper_config.json"):
         self.config = self.load_config(config_file)
-        self.session = requests.Session()
-        self.setup_session()
-        self.deals_database = "automated_deals.json"
-        self.previous_deals = self.load_previous_deals()
+        self.client = self.setup_client()
+        self._driver = None
+        self._smtp = None
+        self._browser_lock = asyncio.Lock()  # One page at a time on the shared driver
+        # Cap concurrent HTTP requests and keep the overall request rate polite
+        self._semaphore = asyncio.Semaphore(self.config['scraping'].get('max_concurrency', 16))
+        self._limiter = _RateLimiter(self.config['scraping'].get('requests_per_second', 5))
+        # Long-lived loop so the client's keep-alive pool survives between checks
+        self._loop = asyncio.new_event_loop()
+        self.deals_database = "automated_deals.jsonl"
+        self._recent_signatures = self.load_recent_signatures()
         
     def load_config(self, config_file: str) -> Dict:
         """Load configuration or create default"""
         try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            return _load_json(config_file)
         except FileNotFoundError:
             return self.create_default_config(config_file)
     
@@ -69,11 +271,14 @@ class GiantFoodAutomatedScraper:
                 "user_agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15"
             },
             "scraping": {
-                "delay_between_requests": 2,
+                "max_concurrency": 16,
+                "requests_per_second": 5,
                 "timeout": 30,
                 "retry_attempts": 3,
-                "use_browser": True,  # Use Selenium for JavaScript-heavy pages
-                "headless": True     # Run browser in background
+                "use_browser": True,  # Fall back to Selenium if the JSON API is blocked
+                "headless": True,    # Run browser in background
+                "chrome_binary": "/opt/chrome-headless-shell/chrome-headless-shell",  # Used if installed
+                "browser_cache_dir": "~/.cache/giant-scraper"  # Profile + HTTP cache kept between runs
             },
             "filters": {
                 "minimum_savings_dollar": 1.50,
@@ -101,25 +306,31 @@ class GiantFoodAutomatedScraper:
             }
         }
         
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        with open(config_file, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
         
         print(f"Created default config: {config_file}")
         print("⚠️  Please update with your email settings before running!")
         return config
     
-    def setup_session(self):
-        """Configure requests session with proper headers"""
-        self.session.headers.update({
-            'User-Agent': self.config['giant_food']['user_agent'],
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Sec-Fetch-Dest': 'empty',
-            'Sec-Fetch-Mode': 'cors',
-            'Sec-Fetch-Site': 'same-origin'
-        })
+    def setup_client(self) -> httpx.AsyncClient:
+        """Create the async HTTP client with proper headers and a bounded keep-alive pool"""
+        # Size the pool to the request concurrency so neither throttles the other
+        max_concurrency = self.config['scraping'].get('max_concurrency', 16)
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            timeout=self.config['scraping']['timeout'],
+            headers={
+                'User-Agent': self.config['giant_food']['user_agent'],
+                'Accept': 'application/json, text/plain, */*',
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Sec-Fetch-Dest': 'empty',
+                'Sec-Fetch-Mode': 'cors',
+                'Sec-Fetch-Site': 'same-origin'
+            }
+        )
     
     def setup_browser(self) -> webdriver.Chrome:
         """Setup Selenium browser for JavaScript-heavy pages"""
@@ -136,51 +347,168 @@ class GiantFoodAutomatedScraper:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Keep the profile and HTTP cache between runs so site assets aren't re-downloaded
+        cache_dir = os.path.expanduser(self.config['scraping'].get('browser_cache_dir', '~/.cache/giant-scraper'))
+        options.add_argument(f"--user-data-dir={os.path.join(cache_dir, 'profile')}")
+        options.add_argument(f"--disk-cache-dir={os.path.join(cache_dir, 'http')}")
+        
+        # chrome-headless-shell starts faster and uses far less memory than full Chrome
+        chrome_binary = self.config['scraping'].get('chrome_binary')
+        if chrome_binary and os.path.exists(chrome_binary):
+            options.binary_location = chrome_binary
+        
         driver = webdriver.Chrome(options=options)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
         return driver
     
-    def load_previous_deals(self) -> List[Dict]:
-        """Load previously found deals to avoid duplicates"""
+    async def _run_in_browser(self, scrape):
+        """Run a blocking browser scrape off the event loop, serialized on the shared driver"""
+        async with self._browser_lock:
+            return await asyncio.to_thread(scrape)
+    
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a rate-limited HTTP request, retrying failures with exponential backoff"""
+        retry_attempts = self.config['scraping']['retry_attempts']
+        
+        for attempt in range(retry_attempts + 1):
+            try:
+                async with self._semaphore, self._limiter:
+                    response = await self.client.request(method, url, **kwargs)
+                if response.status_code not in _RETRY_STATUSES or attempt == retry_attempts:
+                    return response
+                reason = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                if attempt == retry_attempts:
+                    raise
+                reason = str(e)
+            
+            delay = 0.5 * 2 ** attempt
+            logger.warning(f"Request to {url} failed ({reason}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    async def _fetch_api_records(self, method: str, url: str, key: str) -> Optional[List[Dict]]:
+        """Fetch a list of records from a JSON API endpoint; None if the API could not be used"""
+        try:
+            response = await self._request(method, url)
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None
+        
+        if response.status_code in (403, 429):
+            logger.warning(f"Request to {url} was blocked ({response.status_code})")
+            return None
+        
+        if response.is_error:
+            logger.error(f"Error fetching {url}: HTTP {response.status_code}")
+            return None
+        
+        try:
+            payload = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # Anti-bot challenge pages come back as HTML
+            logger.warning(f"Request to {url} did not return JSON")
+            return None
+        
+        records = payload.get(key) if isinstance(payload, dict) else payload
+        if not isinstance(records, list):
+            logger.warning(f"Response from {url} has no '{key}' list")
+            return None
+        
+        return records
+    
+    def _get_driver(self) -> webdriver.Chrome:
+        """Return the shared browser, starting it on first use"""
+        if self._driver is None:
+            self._driver = self.setup_browser()
+        return self._driver
+    
+    def _reset_driver(self):
+        """Quit the shared browser so the next scrape starts a fresh one"""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+            self._driver = None
+    
+    def close(self):
+        """Shut down the shared browser, SMTP connection and HTTP client"""
+        self._reset_driver()
+        
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError) as e:
+                logger.warning(f"Error closing SMTP connection: {e}")
+            self._smtp = None
+        
+        if not self._loop.is_closed():
+            self._loop.run_until_complete(self.client.aclose())
+            self._loop.close()
+    
+    def __del__(self):
+        if hasattr(self, '_loop'):
+            self.close()
+    
+    def load_recent_signatures(self) -> Dict[bytes, datetime]:
+        """Map signatures of deals found within the duplicate window to when they were found"""
+        signatures = {}
+        cutoff_date = datetime.now() - _DUPLICATE_WINDOW
+        
         try:
-            with open(self.deals_database, 'r') as f:
-                return json.load(f)
+            # Deals are appended as they are found, so read newest first and
+            # stop at the first one older than the window
+            for line in _read_lines_reversed(self.deals_database):
+                if not line.strip():
+                    continue
+                try:
+                    prev_deal = orjson.loads(line)
+                    found_date = datetime.fromisoformat(prev_deal['found_date'])
+                    signature = _signature(prev_deal['product_name'], prev_deal['final_price'])
+                except (KeyError, TypeError, ValueError):
+                    logger.warning(f"Skipping unreadable line in {self.deals_database}")
+                    continue
+                
+                if found_date <= cutoff_date:
+                    break
+                signatures.setdefault(signature, found_date)
         except FileNotFoundError:
-            return []
+            pass
+        
+        return signatures
     
     def save_deals(self, deals: List[Deal]):
-        """Save deals to database"""
-        deal_dicts = []
-        for deal in deals:
-            deal_dict = {
-                'product_name': deal.product_name,
-                'original_price': deal.original_price,
-                'sale_price': deal.sale_price,
-                'coupon_discount': deal.coupon_discount,
-                'final_price': deal.final_price,
-                'savings': deal.savings,
-                'savings_percent': deal.savings_percent,
-                'coupon_description': deal.coupon_description,
-                'sale_description': deal.sale_description,
-                'expiry_date': deal.expiry_date,
-                'product_url': deal.product_url,
-                'image_url': deal.image_url,
-                'found_date': datetime.now().isoformat()
-            }
-            deal_dicts.append(deal_dict)
+        """Append deals to the JSON Lines database"""
+        if not deals:
+            return
         
-        with open(self.deals_database, 'w') as f:
-            json.dump(deal_dicts, f, indent=2)
+        data = b"".join(orjson.dumps(self.deal_to_dict(deal)) + b"\n" for deal in deals)
+        with open(self.deals_database, 'a+b') as f:
+            # A write cut short by a crash leaves a last line with no newline;
+            # start on a fresh line so the new deals don't run into it
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
     
-    def scrape_digital_coupons(self) -> Dict[str, Dict]:
-        """Scrape digital coupons using browser automation"""
+    async def scrape_digital_coupons(self) -> Dict[str, Dict]:
+        """Scrape digital coupons from the JSON API, using the browser if the API fails"""
         logger.info("Scraping digital coupons...")
         
-        if not self.config['scraping']['use_browser']:
-            return self.scrape_coupons_api()
-            
-        driver = self.setup_browser()
+        coupons = await self.scrape_coupons_api()
+        if coupons is None:
+            if not self.config['scraping']['use_browser']:
+                return {}
+            logger.info("Falling back to browser for digital coupons")
+            coupons = await self._run_in_browser(self._scrape_coupons_browser)
+        
+        return coupons
+    
+    def _scrape_coupons_browser(self) -> Dict[str, Dict]:
+        """Scrape digital coupons from the rendered coupons page"""
+        driver = self._get_driver()
         coupons = {}
         
         try:
@@ -190,17 +518,17 @@ class GiantFoodAutomatedScraper:
             
             # Wait for page to load
             WebDriverWait(driver, self.config['scraping']['timeout']).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "coupon-card"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, _COUPON_CARD_SELECTOR))
             )
             
-            # Find all coupon elements
-            coupon_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='coupon-card'], .coupon-card, .coupon-item")
+            # Extract all coupon cards in one round-trip
+            coupon_cards = driver.execute_script(_EXTRACT_CARDS_JS, _COUPON_CARD_SELECTOR, _COUPON_FIELDS)
             
-            logger.info(f"Found {len(coupon_elements)} coupon elements")
+            logger.info(f"Found {len(coupon_cards)} coupon elements")
             
-            for element in coupon_elements:
+            for card in coupon_cards:
                 try:
-                    coupon_data = self.extract_coupon_data(element)
+                    coupon_data = self.extract_coupon_data(card)
                     if coupon_data:
                         product_key = self.normalize_product_name(coupon_data['product_name'])
                         coupons[product_key] = coupon_data
@@ -211,89 +539,98 @@ class GiantFoodAutomatedScraper:
             
         except TimeoutException:
             logger.error("Timeout waiting for coupons page to load")
+        except WebDriverException as e:
+            # The browser crashed or its session died; don't reuse it
+            logger.error(f"Browser error scraping coupons: {e}")
+            self._reset_driver()
         except Exception as e:
             logger.error(f"Error scraping coupons: {e}")
-        finally:
-            driver.quit()
         
         logger.info(f"Successfully scraped {len(coupons)} digital coupons")
         return coupons
     
-    def extract_coupon_data(self, element) -> Optional[Dict]:
-        """Extract coupon data from a web element"""
-        try:
-            # Try different selectors for product name
-            product_name = None
-            for selector in ['.product-name', '.coupon-title', 'h3', 'h4', '[data-testid="product-name"]']:
-                try:
-                    product_name = element.find_element(By.CSS_SELECTOR, selector).text.strip()
-                    if product_name:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            if not product_name:
-                return None
-            
-            # Try to find discount amount
-            discount_text = None
-            for selector in ['.discount-amount', '.coupon-value', '.savings', '[data-testid="discount"]']:
-                try:
-                    discount_text = element.find_element(By.CSS_SELECTOR, selector).text.strip()
-                    if discount_text:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            if not discount_text:
-                return None
-            
-            # Extract numeric discount value
-            discount_match = re.search(r'\$?(\d+\.?\d*)', discount_text)
-            if not discount_match:
-                return None
-            
-            discount_amount = float(discount_match.group(1))
-            
-            # Try to find expiry date
-            expiry_date = "Unknown"
-            for selector in ['.expiry-date', '.expires', '.valid-until']:
-                try:
-                    expiry_text = element.find_element(By.CSS_SELECTOR, selector).text.strip()
-                    if expiry_text:
-                        expiry_date = expiry_text
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Try to find qualifying products/description
-            description = discount_text
-            for selector in ['.coupon-description', '.qualifying-products', '.details']:
-                try:
-                    desc_text = element.find_element(By.CSS_SELECTOR, selector).text.strip()
-                    if desc_text:
-                        description = desc_text
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            return {
-                'product_name': product_name,
-                'discount_amount': discount_amount,
-                'description': description,
-                'expiry_date': expiry_date,
-                'coupon_text': discount_text
-            }
-            
-        except Exception as e:
-            logger.warning(f"Error extracting coupon data: {e}")
+    async def scrape_coupons_api(self) -> Optional[Dict[str, Dict]]:
+        """Fetch digital coupons from the site's JSON API; None if the API could not be used"""
+        giant_food = self.config['giant_food']
+        coupons_url = f"{giant_food['base_url']}/api/v6.0/users/{giant_food['store_id']}/coupons"
+        
+        items = await self._fetch_api_records('POST', coupons_url, 'coupons')
+        if items is None:
+            return None
+        
+        coupons = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            coupon_data = self.extract_api_coupon_data(item)
+            if coupon_data:
+                product_key = self.normalize_product_name(coupon_data['product_name'])
+                coupons[product_key] = coupon_data
+        
+        if items and not coupons:
+            # Records came back but none had the fields we expect
+            logger.warning(f"None of {len(items)} API records could be parsed as digital coupons")
             return None
+        
+        logger.info(f"Successfully fetched {len(coupons)} digital coupons from API")
+        return coupons
     
-    def scrape_weekly_sales(self) -> Dict[str, Dict]:
-        """Scrape weekly sales/circular"""
+    def extract_api_coupon_data(self, item: Dict) -> Optional[Dict]:
+        """Extract coupon data from a coupons API record"""
+        product_name = str(item.get('name') or item.get('title') or '').strip()
+        if not product_name:
+            return None
+        
+        discount_text = str(item.get('value') or item.get('discount') or '').strip()
+        discount_match = _PRICE_RE.search(discount_text)
+        if not discount_match:
+            return None
+        
+        return {
+            'product_name': product_name,
+            'discount_amount': float(discount_match.group(1)),
+            'description': item.get('description') or discount_text,
+            'expiry_date': item.get('expirationDate') or "Unknown",
+            'coupon_text': discount_text
+        }
+    
+    def extract_coupon_data(self, card: Dict[str, List[str]]) -> Optional[Dict]:
+        """Extract coupon data from the texts collected for a coupon card"""
+        if not card['product_name'] or not card['discount']:
+            return None
+        
+        product_name = card['product_name'][0]
+        discount_text = card['discount'][0]
+        
+        # Extract numeric discount value
+        discount_match = _PRICE_RE.search(discount_text)
+        if not discount_match:
+            return None
+        
+        return {
+            'product_name': product_name,
+            'discount_amount': float(discount_match.group(1)),
+            'description': card['description'][0] if card['description'] else discount_text,
+            'expiry_date': card['expiry_date'][0] if card['expiry_date'] else "Unknown",
+            'coupon_text': discount_text
+        }
+    
+    async def scrape_weekly_sales(self) -> Dict[str, Dict]:
+        """Scrape weekly sales from the JSON API, using the browser if the API fails"""
         logger.info("Scraping weekly sales...")
         
-        driver = self.setup_browser()
+        sales = await self.scrape_sales_api()
+        if sales is None:
+            if not self.config['scraping']['use_browser']:
+                return {}
+            logger.info("Falling back to browser for weekly sales")
+            sales = await self._run_in_browser(self._scrape_sales_browser)
+        
+        return sales
+    
+    def _scrape_sales_browser(self) -> Dict[str, Dict]:
+        """Scrape sale items from the rendered weekly ad page"""
+        driver = self._get_driver()
         sales = {}
         
         try:
@@ -303,17 +640,17 @@ class GiantFoodAutomatedScraper:
             
             # Wait for page to load
             WebDriverWait(driver, self.config['scraping']['timeout']).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "sale-item"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, _SALE_CARD_SELECTOR))
             )
             
-            # Find all sale elements
-            sale_elements = driver.find_elements(By.CSS_SELECTOR, "[data-testid='sale-item'], .sale-item, .product-card")
+            # Extract all sale cards in one round-trip
+            sale_cards = driver.execute_script(_EXTRACT_CARDS_JS, _SALE_CARD_SELECTOR, _SALE_FIELDS)
             
-            logger.info(f"Found {len(sale_elements)} sale elements")
+            logger.info(f"Found {len(sale_cards)} sale elements")
             
-            for element in sale_elements:
+            for card in sale_cards:
                 try:
-                    sale_data = self.extract_sale_data(element)
+                    sale_data = self.extract_sale_data(card)
                     if sale_data:
                         product_key = self.normalize_product_name(sale_data['product_name'])
                         sales[product_key] = sale_data
@@ -324,85 +661,104 @@ class GiantFoodAutomatedScraper:
                     
         except TimeoutException:
             logger.error("Timeout waiting for sales page to load")
+        except WebDriverException as e:
+            # The browser crashed or its session died; don't reuse it
+            logger.error(f"Browser error scraping sales: {e}")
+            self._reset_driver()
         except Exception as e:
             logger.error(f"Error scraping sales: {e}")
-        finally:
-            driver.quit()
         
         logger.info(f"Successfully scraped {len(sales)} sale items")
         return sales
     
-    def extract_sale_data(self, element) -> Optional[Dict]:
-        """Extract sale data from a web element"""
-        try:
-            # Product name
-            product_name = None
-            for selector in ['.product-name', '.item-name', 'h3', 'h4', '[data-testid="product-name"]']:
-                try:
-                    product_name = element.find_element(By.CSS_SELECTOR, selector).text.strip()
-                    if product_name:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            if not product_name:
-                return None
-            
-            # Sale price
-            sale_price = None
-            for selector in ['.sale-price', '.current-price', '.price-now', '[data-testid="sale-price"]']:
-                try:
-                    price_text = element.find_element(By.CSS_SELECTOR, selector).text.strip()
-                    price_match = re.search(r'\$?(\d+\.?\d*)', price_text)
-                    if price_match:
-                        sale_price = float(price_match.group(1))
-                        break
-                except (NoSuchElementException, ValueError):
-                    continue
-            
-            # Original price
-            original_price = sale_price  # Default to sale price if no original found
-            for selector in ['.original-price', '.was-price', '.price-was', '[data-testid="original-price"]']:
-                try:
-                    price_text = element.find_element(By.CSS_SELECTOR, selector).text.strip()
-                    price_match = re.search(r'\$?(\d+\.?\d*)', price_text)
-                    if price_match:
-                        original_price = float(price_match.group(1))
-                        break
-                except (NoSuchElementException, ValueError):
-                    continue
-            
-            if not sale_price:
-                return None
-            
-            # Sale description
-            sale_description = f"On sale for ${sale_price:.2f}"
-            for selector in ['.sale-description', '.promo-text', '.deal-text']:
-                try:
-                    desc_text = element.find_element(By.CSS_SELECTOR, selector).text.strip()
-                    if desc_text:
-                        sale_description = desc_text
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            return {
-                'product_name': product_name,
-                'original_price': original_price,
-                'sale_price': sale_price,
-                'sale_description': sale_description
-            }
-            
-        except Exception as e:
-            logger.warning(f"Error extracting sale data: {e}")
+    async def scrape_sales_api(self) -> Optional[Dict[str, Dict]]:
+        """Fetch the weekly ad from the site's JSON API; None if the API could not be used"""
+        giant_food = self.config['giant_food']
+        sales_url = f"{giant_food['base_url']}/api/v6.0/stores/{giant_food['store_id']}/weekly_ad"
+        
+        items = await self._fetch_api_records('GET', sales_url, 'items')
+        if items is None:
+            return None
+        
+        sales = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            sale_data = self.extract_api_sale_data(item)
+            if sale_data:
+                product_key = self.normalize_product_name(sale_data['product_name'])
+                sales[product_key] = sale_data
+        
+        if items and not sales:
+            # Records came back but none had the fields we expect
+            logger.warning(f"None of {len(items)} API records could be parsed as sale items")
+            return None
+        
+        logger.info(f"Successfully fetched {len(sales)} sale items from API")
+        return sales
+    
+    def extract_api_sale_data(self, item: Dict) -> Optional[Dict]:
+        """Extract sale data from a weekly ad API record"""
+        product_name = str(item.get('name') or item.get('title') or '').strip()
+        if not product_name:
             return None
+        
+        sale_price = self.parse_price(item.get('salePrice') or item.get('price'))
+        if not sale_price:
+            return None
+        
+        # Default to sale price if no original found
+        original_price = self.parse_price(item.get('regularPrice') or item.get('wasPrice')) or sale_price
+        
+        return {
+            'product_name': product_name,
+            'original_price': original_price,
+            'sale_price': sale_price,
+            'sale_description': item.get('promoText') or item.get('description') or f"On sale for ${sale_price:.2f}"
+        }
+    
+    def parse_price(self, value) -> Optional[float]:
+        """Parse a price given as a number or as text like '$3.99'"""
+        if isinstance(value, (int, float)):
+            return float(value)
+        
+        price_match = _PRICE_RE.search(str(value or ''))
+        return float(price_match.group(1)) if price_match else None
+    
+    def extract_sale_data(self, card: Dict[str, List[str]]) -> Optional[Dict]:
+        """Extract sale data from the texts collected for a sale card"""
+        if not card['product_name']:
+            return None
+        
+        sale_price = self.first_price(card['sale_price'])
+        if not sale_price:
+            return None
+        
+        # Default to sale price if no original found
+        original_price = self.first_price(card['original_price'])
+        if original_price is None:
+            original_price = sale_price
+        
+        return {
+            'product_name': card['product_name'][0],
+            'original_price': original_price,
+            'sale_price': sale_price,
+            'sale_description': card['sale_description'][0] if card['sale_description'] else f"On sale for ${sale_price:.2f}"
+        }
+    
+    def first_price(self, texts: List[str]) -> Optional[float]:
+        """Return the first price that can be parsed from a list of candidate texts"""
+        for text in texts:
+            price = self.parse_price(text)
+            if price is not None:
+                return price
+        return None
     
     def normalize_product_name(self, name: str) -> str:
         """Normalize product name for matching"""
         # Remove brand variations, sizes, etc. for better matching
-        normalized = re.sub(r'\b\d+(\.\d+)?\s*(oz|lb|ct|fl oz|ml|l)\b', '', name.lower())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        # split/join collapses and trims whitespace in one pass
+        return " ".join(_SIZE_RE.sub('', name.lower()).split())
     
     def find_double_deals(self, coupons: Dict, sales: Dict) -> List[Deal]:
         """Find products that have both coupons and sales"""
@@ -410,13 +766,30 @@ class GiantFoodAutomatedScraper:
         
         logger.info(f"Matching {len(coupons)} coupons with {len(sales)} sales...")
         
+        # Index sales by word so each coupon is only compared with sales sharing a word
+        sale_items = list(sales.items())
+        sale_words = [frozenset(sale_key.split()) for sale_key, _ in sale_items]
+        postings = defaultdict(set)
+        for index, words in enumerate(sale_words):
+            for word in words:
+                postings[word].add(index)
+        
         for coupon_key, coupon_data in coupons.items():
-            for sale_key, sale_data in sales.items():
+            coupon_words = frozenset(coupon_key.split())
+            candidates = set()
+            for word in coupon_words:
+                candidates.update(postings.get(word, ()))
+            
+            # Visit candidates in scrape order so tied deals keep a stable order
+            for index in sorted(candidates):
+                sale_key, sale_data = sale_items[index]
                 # Check if products match (fuzzy matching)
-                if self.products_match(coupon_key, sale_key, coupon_data, sale_data):
-                    deal = self.create_deal_object(coupon_data, sale_data)
+                if self.products_match(coupon_key, sale_key, coupon_words, sale_words[index]):
+                    final_price, savings, savings_percent = self.calculate_savings(coupon_data, sale_data)
                     
-                    if self.deal_meets_criteria(deal):
+                    # Only build a Deal for pairs that pass the filters
+                    if self.deal_meets_criteria(sale_data['original_price'], savings, savings_percent):
+                        deal = self.create_deal_object(coupon_data, sale_data, final_price, savings, savings_percent)
                         deals.append(deal)
                         logger.info(f"Found deal: {deal.product_name} - Save ${deal.savings:.2f}")
         
@@ -426,7 +799,8 @@ class GiantFoodAutomatedScraper:
         logger.info(f"Found {len(deals)} double-savings deals")
         return deals
     
-    def products_match(self, coupon_key: str, sale_key: str, coupon_data: Dict, sale_data: Dict) -> bool:
+    def products_match(self, coupon_key: str, sale_key: str,
+                       coupon_words: frozenset, sale_words: frozenset) -> bool:
         """Determine if coupon and sale are for the same product"""
         # Direct key match
         if coupon_key == sale_key:
@@ -436,32 +810,27 @@ class GiantFoodAutomatedScraper:
         if coupon_key in sale_key or sale_key in coupon_key:
             return True
         
-        # Check brand names and key terms
-        coupon_words = set(coupon_key.split())
-        sale_words = set(sale_key.split())
-        
         # If they share significant words, consider it a match
-        common_words = coupon_words.intersection(sale_words)
-        if len(common_words) >= 2:  # At least 2 words in common
-            return True
-        
-        return False
+        return len(coupon_words & sale_words) >= 2  # At least 2 words in common
     
-    def create_deal_object(self, coupon_data: Dict, sale_data: Dict) -> Deal:
-        """Create a Deal object from coupon and sale data"""
+    def calculate_savings(self, coupon_data: Dict, sale_data: Dict) -> Tuple[float, float, float]:
+        """Calculate final price, savings and savings percent for a coupon/sale pair"""
         original_price = sale_data['original_price']
-        sale_price = sale_data['sale_price']
-        coupon_discount = coupon_data['discount_amount']
         
-        final_price = max(0, sale_price - coupon_discount)
+        final_price = max(0, sale_data['sale_price'] - coupon_data['discount_amount'])
         savings = original_price - final_price
         savings_percent = (savings / original_price * 100) if original_price > 0 else 0
         
+        return final_price, savings, savings_percent
+    
+    def create_deal_object(self, coupon_data: Dict, sale_data: Dict, final_price: float,
+                           savings: float, savings_percent: float) -> Deal:
+        """Create a Deal object from coupon and sale data"""
         return Deal(
             product_name=sale_data['product_name'],
-            original_price=original_price,
-            sale_price=sale_price,
-            coupon_discount=coupon_discount,
+            original_price=sale_data['original_price'],
+            sale_price=sale_data['sale_price'],
+            coupon_discount=coupon_data['discount_amount'],
             final_price=final_price,
             savings=savings,
             savings_percent=savings_percent,
@@ -472,19 +841,19 @@ class GiantFoodAutomatedScraper:
             image_url=''
         )
     
-    def deal_meets_criteria(self, deal: Deal) -> bool:
-        """Check if deal meets configured criteria"""
+    def deal_meets_criteria(self, original_price: float, savings: float, savings_percent: float) -> bool:
+        """Check if a deal's figures meet configured criteria"""
         filters = self.config['filters']
         
         # Minimum savings checks
-        if deal.savings < filters['minimum_savings_dollar']:
+        if savings < filters['minimum_savings_dollar']:
             return False
         
-        if deal.savings_percent < filters['minimum_savings_percent']:
+        if savings_percent < filters['minimum_savings_percent']:
             return False
         
         # Maximum price check
-        if deal.original_price > filters['max_original_price']:
+        if original_price > filters['max_original_price']:
             return False
         
         return True
@@ -517,125 +886,64 @@ class GiantFoodAutomatedScraper:
             msg.attach(MIMEText(text_body, 'plain'))
             msg.attach(MIMEText(html_body, 'html'))
             
-            # Send email
-            server = smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port'])
-            server.starttls()
-            server.login(email_config['sender_email'], email_config['sender_password'])
-            server.send_message(msg)
-            server.quit()
+            # Send email, reconnecting once if the server dropped the kept-alive connection
+            try:
+                self._get_smtp().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+                self._get_smtp().send_message(msg)
             
             logger.info(f"Email sent successfully with {len(deals)} deals")
             
         except Exception as e:
             logger.error(f"Failed to send email: {e}")
     
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return the shared authenticated SMTP connection, connecting on first use"""
+        if self._smtp is None:
+            email_config = self.config['notifications']['email']
+            
+            # Port 465 is implicit TLS; anything else upgrades with STARTTLS
+            implicit_tls = email_config['smtp_port'] == 465
+            smtp_class = smtplib.SMTP_SSL if implicit_tls else smtplib.SMTP
+            server = smtp_class(email_config['smtp_server'], email_config['smtp_port'])
+            
+            try:
+                if not implicit_tls:
+                    server.starttls()
+                server.login(email_config['sender_email'], email_config['sender_password'])
+            except Exception:
+                # Don't leak the socket when the handshake or login fails
+                server.close()
+                raise
+            self._smtp = server
+        
+        return self._smtp
+    
     def create_email_html(self, deals: List[Deal]) -> str:
         """Create HTML email content"""
         total_savings = sum(deal.savings for deal in deals)
         
-        html = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <h1 style="color: #e31837;">🛍️ Giant Food Double-Savings Alert!</h1>
-            <p style="font-size: 18px; color: #333;">
-                Found <strong>{len(deals)} deals</strong> with both sales AND digital coupons!<br>
-                💰 Total potential savings: <strong>${total_savings:.2f}</strong>
-            </p>
-            
-            <div style="background: #f5f5f5; padding: 15px; border-radius: 8px; margin: 20px 0;">
-                <p style="margin: 0; font-size: 14px; color: #666;">
-                    ✅ These items are on sale AND have digital coupons<br>
-                    📱 Make sure to clip the coupons in your Giant Food app<br>
-                    ⏰ Check expiration dates before shopping
-                </p>
-            </div>
-        """
-        
-        for i, deal in enumerate(deals, 1):
-            html += f"""
-            <div style="border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 8px;">
-                <h3 style="color: #e31837; margin: 0 0 10px 0;">{i}. {deal.product_name}</h3>
-                <div style="display: flex; justify-content: space-between; margin: 10px 0;">
-                    <div>
-                        <p style="margin: 5px 0;"><strong>Was:</strong> ${deal.original_price:.2f}</p>
-                        <p style="margin: 5px 0;"><strong>Sale:</strong> ${deal.sale_price:.2f}</p>
-                        <p style="margin: 5px 0;"><strong>After Coupon:</strong> ${deal.final_price:.2f}</p>
-                    </div>
-                    <div style="text-align: right;">
-                        <p style="margin: 5px 0; font-size: 18px; color: #28a745;">
-                            <strong>💰 Save ${deal.savings:.2f}</strong>
-                        </p>
-                        <p style="margin: 5px 0; color: #28a745;">
-                            ({deal.savings_percent:.0f}% off!)
-                        </p>
-                    </div>
-                </div>
-                <p style="margin: 5px 0; font-size: 12px; color: #666;">
-                    🎫 Coupon: {deal.coupon_description}<br>
-                    🏷️ Sale: {deal.sale_description}
-                </p>
-            </div>
-            """
-        
-        html += """
-            <div style="background: #e8f5e8; padding: 15px; border-radius: 8px; margin: 20px 0;">
-                <h3 style="color: #28a745; margin: 0 0 10px 0;">📝 Shopping Tips:</h3>
-                <ul style="margin: 0; padding-left: 20px;">
-                    <li>Open your Giant Food app and "clip" the digital coupons</li>
-                    <li>Use your loyalty card when checking out</li>
-                    <li>Check expiration dates on both sales and coupons</li>
-                    <li>Shop early in the week for best selection</li>
-                </ul>
-            </div>
-            
-            <p style="text-align: center; color: #666; font-size: 12px; margin-top: 30px;">
-                Generated by Giant Food Deal Tracker<br>
-                {datetime.now().strftime('%Y-%m-%d %H:%M')}
-            </p>
-        </body>
-        </html>
-        """
+        parts = [_HTML_HEADER_TMPL.format(count=len(deals), total_savings=total_savings)]
+        parts.extend(_HTML_DEAL_TMPL.format(i=i, deal=deal) for i, deal in enumerate(deals, 1))
+        parts.append(_HTML_TIPS)
+        parts.append(_HTML_FOOTER_TMPL.format(timestamp=datetime.now().strftime('%Y-%m-%d %H:%M')))
         
-        return html
+        return "".join(parts)
     
     def create_email_text(self, deals: List[Deal]) -> str:
         """Create plain text email content"""
         total_savings = sum(deal.savings for deal in deals)
         
-        text = f"""🛍️ Giant Food Double-Savings Alert!
-
-Found {len(deals)} deals with both sales AND digital coupons!
-💰 Total potential savings: ${total_savings:.2f}
-
-✅ These items are on sale AND have digital coupons
-📱 Make sure to clip the coupons in your Giant Food app
-⏰ Check expiration dates before shopping
-
-DEALS FOUND:
-============
-"""
-        
-        for i, deal in enumerate(deals, 1):
-            text += f"""
-{i}. {deal.product_name}
-   Was: ${deal.original_price:.2f} → Sale: ${deal.sale_price:.2f} → Final: ${deal.final_price:.2f}
-   💰 YOU SAVE: ${deal.savings:.2f} ({deal.savings_percent:.0f}% off!)
-   🎫 Coupon: {deal.coupon_description}
-   🏷️ Sale: {deal.sale_description}
-   {'-' * 50}"""
-        
-        text += f"""
-
-📝 Shopping Tips:
-• Open your Giant Food app and "clip" the digital coupons
-• Use your loyalty card when checking out
-• Check expiration dates on both sales and coupons
-• Shop early in the week for best selection
-
-Generated by Giant Food Deal Tracker - {datetime.now().strftime('%Y-%m-%d %H:%M')}
-"""
+        parts = [_TEXT_HEADER_TMPL.format(count=len(deals), total_savings=total_savings)]
+        parts.extend(_TEXT_DEAL_TMPL.format(i=i, deal=deal) for i, deal in enumerate(deals, 1))
+        parts.append(_TEXT_FOOTER_TMPL.format(timestamp=datetime.now().strftime('%Y-%m-%d %H:%M')))
         
-        return text
+        return "".join(parts)
+    
+    async def scrape_all(self):
+        """Scrape digital coupons and weekly sales concurrently"""
+        return await asyncio.gather(self.scrape_digital_coupons(), self.scrape_weekly_sales())
     
     def run_automated_check(self):
         """Run a complete automated check for deals"""
@@ -643,13 +951,8 @@ Generated by Giant Food Deal Tracker - {datetime.now().strftime('%Y-%m-%d %H:%M'
         logger.info("🤖 Starting automated Giant Food deal check...")
         
         try:
-            # Step 1: Scrape digital coupons
-            coupons = self.scrape_digital_coupons()
-            time.sleep(self.config['scraping']['delay_between_requests'])
-            
-            # Step 2: Scrape weekly sales
-            sales = self.scrape_weekly_sales()
-            time.sleep(self.config['scraping']['delay_between_requests'])
+            # Steps 1-2: Scrape digital coupons and weekly sales concurrently
+            coupons, sales = self._loop.run_until_complete(self.scrape_all())
             
             # Step 3: Find double deals
             deals = self.find_double_deals(coupons, sales)
@@ -657,9 +960,12 @@ Generated by Giant Food Deal Tracker - {datetime.now().strftime('%Y-%m-%d %H:%M'
             # Step 4: Filter new deals (avoid duplicates)
             new_deals = self.filter_new_deals(deals)
             
-            # Step 5: Save deals
-            if deals:
-                self.save_deals(deals)
+            # Step 5: Save new deals and remember them for duplicate detection
+            if new_deals:
+                self.save_deals(new_deals)
+                found_date = datetime.now()
+                for deal in new_deals:
+                    self._recent_signatures[_signature(deal.product_name, deal.final_price)] = found_date
             
             # Step 6: Send notifications
             if new_deals:
@@ -668,9 +974,6 @@ Generated by Giant Food Deal Tracker - {datetime.now().strftime('%Y-%m-%d %H:%M'
             else:
                 logger.info("No new deals found")
             
-            # Update previous deals
-            self.previous_deals.extend([self.deal_to_dict(deal) for deal in new_deals])
-            
             duration = datetime.now() - start_time
             logger.info(f"✅ Automated check completed in {duration.total_seconds():.1f} seconds")
             logger.info(f"Found {len(deals)} total deals, {len(new_deals)} new deals")
@@ -680,41 +983,21 @@ Generated by Giant Food Deal Tracker - {datetime.now().strftime('%Y-%m-%d %H:%M'
     
     def filter_new_deals(self, deals: List[Deal]) -> List[Deal]:
         """Filter out deals we've already seen recently"""
-        new_deals = []
-        
-        # Create set of previous deal signatures
-        previous_signatures = set()
-        cutoff_date = datetime.now() - timedelta(days=3)  # Only check last 3 days
-        
-        for prev_deal in self.previous_deals:
-            try:
-                deal_date = datetime.fromisoformat(prev_deal.get('found_date', ''))
-                if deal_date > cutoff_date:
-                    signature = f"{prev_deal['product_name']}_{prev_deal['final_price']}"
-                    previous_signatures.add(signature)
-            except:
-                continue
-        
-        # Filter new deals
-        for deal in deals:
-            signature = f"{deal.product_name}_{deal.final_price}"
-            if signature not in previous_signatures:
-                new_deals.append(deal)
+        # Forget signatures that have aged out of the window
+        cutoff_date = datetime.now() - _DUPLICATE_WINDOW
+        self._recent_signatures = {
+            signature: found_date for signature, found_date in self._recent_signatures.items()
+            if found_date > cutoff_date
+        }
         
-        return new_deals
+        return [
+            deal for deal in deals
+            if _signature(deal.product_name, deal.final_price) not in self._recent_signatures
+        ]
     
     def deal_to_dict(self, deal: Deal) -> Dict:
         """Convert Deal object to dictionary"""
-        return {
-            'product_name': deal.product_name,
-            'original_price': deal.original_price,
-            'sale_price': deal.sale_price,
-            'coupon_discount': deal.coupon_discount,
-            'final_price': deal.final_price,
-            'savings': deal.savings,
-            'savings_percent': deal.savings_percent,
-            'found_date': datetime.now().isoformat()
-        }
+        return {**asdict(deal), 'found_date': datetime.now().isoformat()}
     
     def print_deals_summary(self, deals: List[Deal]):
         """Print a summary of found deals to console"""
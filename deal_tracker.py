@@ -4,59 +4,314 @@ Giant Food Deal Tracker
 Tracks items that have both digital coupons AND sales for maximum savings
 """
 
+import heapq
 import json
 import os
+import shutil
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from operator import attrgetter
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; the standard library works, just slower
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, default=asdict).encode()
+    _loads = json.loads
+
+# Compact the log once it holds more than this many events per deal
+_COMPACT_RATIO = 2
+
+# How many of the best active deals the menu's "Show active deals" lists
+_TOP_DEALS = 20
+
+# Listing templates for a single deal, filled in with str.format
+_DEAL_TMPL = """#{deal.id} {deal.product} ({status})
+    Original: ${deal.original_price:.2f} → Sale: ${deal.sale_price:.2f} → Final: ${deal.final_price:.2f}
+    💰 Savings: ${deal.total_savings:.2f} ({deal.savings_percent:.1f}%) | Coupon: -${deal.coupon_discount:.2f}
+    📅 Found: {deal.date_found:.10}
+"""
+_DEAL_STORE_TMPL = "    🏪 Store: {deal.store_location}\n"
+_DEAL_NOTES_TMPL = "    📝 Notes: {deal.notes}\n"
+_DEAL_PURCHASED_TMPL = "    🛍️  Purchased: {deal.purchase_date:.10}\n"
+_DEAL_RULE = "-" * 50 + "\n"
+
+MENU = """
+🛍️  Giant Food Deal Tracker
+========================================
+1. 📱 Add new deal
+2. 👀 Show active deals
+3. 📋 Show all deals
+4. ✅ Mark deal as purchased
+5. 📝 Generate shopping list
+6. 📊 Show statistics
+7. 🚪 Exit
+"""
+
+def _is_json_array(path: str) -> bool:
+    """Whether a file holds the old single JSON array database rather than an event log"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(4096).lstrip()[:1] == b"["
+    except FileNotFoundError:
+        return False
+
+@dataclass(slots=True)
+class Deal:
+    id: int
+    product: str
+    original_price: float
+    sale_price: float
+    coupon_discount: float
+    final_price: float
+    total_savings: float
+    savings_percent: float
+    date_found: str
+    store_location: str = ""
+    notes: str = ""
+    purchased: bool = False
+    purchase_date: Optional[str] = None
 
 class DealTracker:
-    def __init__(self, data_file: str = "deals_database.json"):
+    def __init__(self, data_file: str = "deals.jsonl", legacy_file: str = "deals_database.json"):
         self.data_file = data_file
-        self.deals = self.load_deals()
-        
-    def load_deals(self) -> List[Dict]:
-        """Load existing deals from JSON file"""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                print(f"⚠️  Could not load {self.data_file}, starting fresh")
-                return []
-        return []
+        self._log_events = 0
+        self._torn_tail = False
+        self._unreadable_entries = 0
+        self._read_only = False
+        self._active_cache: Optional[List[Deal]] = None
+        self._purchased_cache: Optional[List[Deal]] = None
+        self._total_saved = 0.0
+        self._potential_savings = 0.0
+        
+        # An old single-JSON database passed as data_file is converted in place
+        migrate_in_place = _is_json_array(self.data_file)
+        self.deals = [] if migrate_in_place else self.load_deals()
+        self._pending = []
+        self._batch_mode = False
+        
+        if migrate_in_place:
+            backup_file = self.data_file + ".bak"
+            shutil.copy2(self.data_file, backup_file)
+            legacy_deals = self.load_legacy_deals(self.data_file)
+            if legacy_deals is None:
+                # Appending events to the old file would only damage it further
+                self._read_only = True
+                print(f"⚠️  Left {self.data_file} unchanged (copy in {backup_file}); changes will not be saved")
+            else:
+                self.deals = legacy_deals
+                self._invalidate_partitions()
+                self.compact()
+                print(f"📦 Converted {self.data_file} to the deal log format (original kept as {backup_file})")
+        elif not os.path.exists(self.data_file) and os.path.exists(legacy_file):
+            # Carry deals over from the old single-JSON database
+            self.deals = self.load_legacy_deals(legacy_file)
+            if self.deals is None:
+                print("⚠️  Starting fresh")
+                self.deals = []
+            self._invalidate_partitions()
+            if self.deals:
+                self.compact()
+        elif self._unreadable_entries:
+            # Rewrite the log so damaged entries aren't skipped again on every start
+            self.compact()
+        
+        # Index deals by id for constant-time lookups
+        self._by_id = {deal.id: deal for deal in self.deals}
+        self._next_id = max(self._by_id, default=0) + 1
+        self._rebuild_stats()
+    
+    def __enter__(self):
+        """Batch changes: defer saving until the with-block exits"""
+        self._batch_mode = True
+        return self
     
-    def save_deals(self):
-        """Save deals to JSON file"""
-        with open(self.data_file, 'w') as f:
-            json.dump(self.deals, f, indent=2)
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch_mode = False
+        self.commit()
+        return False
+        
+    def load_deals(self) -> List[Deal]:
+        """Load deals by replaying the JSON Lines event log"""
+        self._invalidate_partitions()
+        deals = []
+        by_id = {}
+        
+        if not os.path.exists(self.data_file):
+            return deals
+        
+        with open(self.data_file, 'rb') as f:
+            for line in f:
+                # A write cut short by a crash leaves a last line with no newline
+                self._torn_tail = not line.endswith(b"\n")
+                if not line.strip():
+                    continue
+                self._log_events += 1
+                try:
+                    event = _loads(line)
+                    if event['op'] == 'add':
+                        deal = Deal(**event['deal'])
+                        deals.append(deal)
+                        by_id[deal.id] = deal
+                    elif event['op'] == 'purchase' and event['id'] in by_id:
+                        purchase_date = event['purchase_date']
+                        deal = by_id[event['id']]
+                        deal.purchased = True
+                        deal.purchase_date = purchase_date
+                except (ValueError, KeyError, TypeError):
+                    # Torn lines (even mid UTF-8 sequence) and JSON that isn't a well-formed event
+                    print(f"⚠️  Skipping unreadable entry in {self.data_file}")
+                    self._unreadable_entries += 1
+        
+        return deals
+    
+    def load_legacy_deals(self, legacy_file: str) -> Optional[List[Deal]]:
+        """Load deals from the old single-JSON database file; None if it can't be read"""
+        try:
+            with open(legacy_file, 'rb') as f:
+                return [Deal(**deal) for deal in _loads(f.read())]
+        except (ValueError, TypeError):
+            # Undecodable bytes, bad JSON, or rows that aren't deal records
+            print(f"⚠️  Could not load {legacy_file}")
+            return None
+    
+    def commit(self):
+        """Append pending changes to the event log"""
+        if not self._pending:
+            return
+        
+        if self._read_only:
+            self._pending = []
+            print(f"⚠️  Not saved: {self.data_file} could not be converted to the deal log format")
+            return
+        
+        data = b"".join(_dumps(event) + b"\n" for event in self._pending)
+        if self._torn_tail:
+            # Start on a fresh line so new events don't run into the torn one
+            data = b"\n" + data
+            self._torn_tail = False
+        
+        with open(self.data_file, 'ab') as f:
+            f.write(data)
+        self._log_events += len(self._pending)
+        self._pending = []
         print(f"💾 Saved {len(self.deals)} deals to {self.data_file}")
+        
+        if self._log_events > _COMPACT_RATIO * len(self.deals):
+            self.compact()
+    
+    def compact(self):
+        """Atomically rewrite the event log as a snapshot of the current deals"""
+        tmp_file = self.data_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(b"".join(_dumps({'op': 'add', 'deal': deal}) + b"\n" for deal in self.deals))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.data_file)
+        
+        self._torn_tail = False
+        self._unreadable_entries = 0
+        self._log_events = len(self.deals)
+        self._pending = []
+    
+    def _invalidate_partitions(self):
+        """Drop the cached active/purchased lists after a change"""
+        self._active_cache = None
+        self._purchased_cache = None
+    
+    def _partition(self):
+        """Split deals into active and purchased lists and total their savings in a single pass"""
+        active, purchased = [], []
+        total_saved = potential_savings = 0.0
+        for deal in self.deals:
+            if deal.purchased:
+                purchased.append(deal)
+                total_saved += deal.total_savings
+            else:
+                active.append(deal)
+                potential_savings += deal.total_savings
+        self._active_cache = active
+        self._purchased_cache = purchased
+        self._total_saved = total_saved
+        self._potential_savings = potential_savings
+    
+    def _get_active(self) -> List[Deal]:
+        """Unpurchased deals, cached until the next change"""
+        if self._active_cache is None:
+            self._partition()
+        return self._active_cache
+    
+    def _get_purchased(self) -> List[Deal]:
+        """Purchased deals, cached until the next change"""
+        if self._purchased_cache is None:
+            self._partition()
+        return self._purchased_cache
+    
+    def _get_totals(self) -> Tuple[float, float]:
+        """Savings already made and still available, cached with the partitions"""
+        if self._active_cache is None:
+            self._partition()
+        return self._total_saved, self._potential_savings
+    
+    def _rebuild_stats(self):
+        """Recompute the best-deal records used by get_stats"""
+        self._best_deal: Optional[Deal] = None
+        self._best_percent: Optional[Deal] = None
+        for deal in self.deals:
+            self._count_deal(deal)
+    
+    def _count_deal(self, deal: Deal):
+        """Fold a deal into the best-deal records"""
+        if self._best_deal is None or deal.total_savings > self._best_deal.total_savings:
+            self._best_deal = deal
+        if self._best_percent is None or deal.savings_percent > self._best_percent.savings_percent:
+            self._best_percent = deal
+    
+    def _record(self, event: Dict):
+        """Queue a change for the event log, writing it right away unless batching"""
+        self._pending.append(event)
+        if not self._batch_mode:
+            self.commit()
     
     def add_deal(self, product_name: str, original_price: float, 
                  sale_price: float, coupon_discount: float, 
-                 store_location: str = "", notes: str = "") -> Dict:
-        """Add a new double-savings deal"""
+                 store_location: str = "", notes: str = "",
+                 timestamp: Optional[str] = None) -> Deal:
+        """Add a new double-savings deal
+        
+        Bulk imports can pass one precomputed ISO `timestamp` for every deal
+        instead of reading the clock per deal.
+        """
         
         final_price = max(0, sale_price - coupon_discount)
         total_savings = original_price - final_price
         savings_percent = (total_savings / original_price) * 100 if original_price > 0 else 0
         
-        deal = {
-            'id': len(self.deals) + 1,
-            'product': product_name,
-            'original_price': round(original_price, 2),
-            'sale_price': round(sale_price, 2),
-            'coupon_discount': round(coupon_discount, 2),
-            'final_price': round(final_price, 2),
-            'total_savings': round(total_savings, 2),
-            'savings_percent': round(savings_percent, 1),
-            'date_found': datetime.now().isoformat(),
-            'store_location': store_location,
-            'notes': notes,
-            'purchased': False
-        }
+        deal = Deal(
+            id=self._next_id,
+            product=product_name,
+            original_price=original_price,
+            sale_price=sale_price,
+            coupon_discount=coupon_discount,
+            final_price=final_price,
+            total_savings=total_savings,
+            savings_percent=savings_percent,
+            date_found=timestamp or datetime.now().isoformat(),
+            store_location=store_location,
+            notes=notes
+        )
         
         self.deals.append(deal)
-        self.save_deals()
+        self._by_id[deal.id] = deal
+        self._next_id += 1
+        self._invalidate_partitions()
+        self._count_deal(deal)
+        self._record({'op': 'add', 'deal': deal})
         
         print(f"✅ Added: {product_name}")
         print(f"   💰 You save: ${total_savings:.2f} ({savings_percent:.1f}%)")
@@ -66,34 +321,40 @@ class DealTracker:
     
     def mark_purchased(self, deal_id: int):
         """Mark a deal as purchased"""
-        for deal in self.deals:
-            if deal['id'] == deal_id:
-                deal['purchased'] = True
-                deal['purchase_date'] = datetime.now().isoformat()
-                self.save_deals()
-                print(f"✅ Marked '{deal['product']}' as purchased!")
-                return
-        print(f"❌ Deal #{deal_id} not found")
+        deal = self._by_id.get(deal_id)
+        if deal is None:
+            print(f"❌ Deal #{deal_id} not found")
+            return
+        
+        deal.purchased = True
+        deal.purchase_date = datetime.now().isoformat()
+        self._invalidate_partitions()
+        self._record({'op': 'purchase', 'id': deal_id, 'purchase_date': deal.purchase_date})
+        print(f"✅ Marked '{deal.product}' as purchased!")
     
-    def show_active_deals(self):
-        """Show all unpurchased deals"""
-        active_deals = [deal for deal in self.deals if not deal['purchased']]
+    def show_active_deals(self, limit: Optional[int] = None):
+        """Show unpurchased deals, optionally only the top `limit` by savings (non-positive means all)"""
+        active_deals = self._get_active()
         
         if not active_deals:
             print("📭 No active deals found. Add some deals first!")
             return
         
-        # Sort by savings amount (highest first)
-        active_deals.sort(key=lambda x: x['total_savings'], reverse=True)
+        # Sort by savings amount (highest first); a heap avoids sorting deals we won't show
+        if limit is not None and 0 < limit < len(active_deals):
+            shown_deals = heapq.nlargest(limit, active_deals, key=attrgetter('total_savings'))
+        else:
+            shown_deals = sorted(active_deals, key=attrgetter('total_savings'), reverse=True)
         
-        total_potential_savings = sum(deal['total_savings'] for deal in active_deals)
+        _, total_potential_savings = self._get_totals()
         
         print(f"\n🛍️  Active Giant Food Double-Savings Deals")
         print(f"📊 {len(active_deals)} deals • ${total_potential_savings:.2f} potential savings")
+        if len(shown_deals) < len(active_deals):
+            print(f"🔝 Showing top {len(shown_deals)} by savings")
         print("=" * 70)
         
-        for deal in active_deals:
-            self._print_deal(deal)
+        sys.stdout.write("".join(self._format_deal(deal) for deal in shown_deals))
     
     def show_all_deals(self):
         """Show all deals (purchased and unpurchased)"""
@@ -102,63 +363,58 @@ class DealTracker:
             return
         
         # Sort by date found (newest first)
-        sorted_deals = sorted(self.deals, key=lambda x: x['date_found'], reverse=True)
-        
-        purchased_deals = [d for d in self.deals if d['purchased']]
-        active_deals = [d for d in self.deals if not d['purchased']]
+        sorted_deals = sorted(self.deals, key=attrgetter('date_found'), reverse=True)
         
-        total_saved = sum(deal['total_savings'] for deal in purchased_deals)
-        potential_savings = sum(deal['total_savings'] for deal in active_deals)
+        total_saved, potential_savings = self._get_totals()
         
         print(f"\n🛍️  All Giant Food Double-Savings Deals")
         print(f"📊 {len(self.deals)} total deals")
         print(f"💰 ${total_saved:.2f} already saved • ${potential_savings:.2f} potential savings")
         print("=" * 70)
         
-        for deal in sorted_deals:
-            self._print_deal(deal)
+        sys.stdout.write("".join(self._format_deal(deal) for deal in sorted_deals))
     
-    def _print_deal(self, deal: Dict):
-        """Helper method to print a single deal"""
-        status = "✅ PURCHASED" if deal['purchased'] else "🛒 Available"
-        
-        print(f"#{deal['id']} {deal['product']} ({status})")
-        print(f"    Original: ${deal['original_price']:.2f} → Sale: ${deal['sale_price']:.2f} → Final: ${deal['final_price']:.2f}")
-        print(f"    💰 Savings: ${deal['total_savings']:.2f} ({deal['savings_percent']}%) | Coupon: -${deal['coupon_discount']:.2f}")
-        print(f"    📅 Found: {deal['date_found'][:10]}")
-        
-        if deal['store_location']:
-            print(f"    🏪 Store: {deal['store_location']}")
-        if deal['notes']:
-            print(f"    📝 Notes: {deal['notes']}")
-        if deal['purchased'] and 'purchase_date' in deal:
-            print(f"    🛍️  Purchased: {deal['purchase_date'][:10]}")
-        
-        print("-" * 50)
+    def _format_deal(self, deal: Deal) -> str:
+        """Helper method to render a single deal as a block of text"""
+        status = "✅ PURCHASED" if deal.purchased else "🛒 Available"
+        
+        buf = _DEAL_TMPL.format(deal=deal, status=status)
+        
+        if deal.store_location:
+            buf += _DEAL_STORE_TMPL.format(deal=deal)
+        if deal.notes:
+            buf += _DEAL_NOTES_TMPL.format(deal=deal)
+        if deal.purchased and deal.purchase_date:
+            buf += _DEAL_PURCHASED_TMPL.format(deal=deal)
+        
+        return buf + _DEAL_RULE
     
     def get_shopping_list(self):
         """Generate a shopping list of active deals"""
-        active_deals = [deal for deal in self.deals if not deal['purchased']]
+        active_deals = self._get_active()
         
         if not active_deals:
             print("📝 No active deals for shopping list")
             return
         
-        # Sort by store location, then by savings
-        active_deals.sort(key=lambda x: (x['store_location'], -x['total_savings']))
+        # Group by store location, then sort each store's deals by savings
+        stores = defaultdict(list)
+        for deal in active_deals:
+            stores[deal.store_location].append(deal)
         
         print(f"\n📝 Shopping List - {len(active_deals)} Double-Savings Deals")
         print("=" * 50)
         
-        current_store = ""
-        for deal in active_deals:
-            if deal['store_location'] != current_store:
-                current_store = deal['store_location']
-                print(f"\n🏪 {current_store or 'Giant Food'}")
-                print("-" * 30)
+        parts = []
+        for store in sorted(stores):
+            # Deals without a store sit under the list header, as before
+            if store:
+                parts.append(f"\n🏪 {store}\n" + "-" * 30 + "\n")
             
-            print(f"☐ {deal['product']} - ${deal['final_price']:.2f}")
-            print(f"   (Save ${deal['total_savings']:.2f} with sale + coupon)")
+            for deal in sorted(stores[store], key=attrgetter('total_savings'), reverse=True):
+                parts.append(f"☐ {deal.product} - ${deal.final_price:.2f}\n"
+                             f"   (Save ${deal.total_savings:.2f} with sale + coupon)\n")
+        sys.stdout.write("".join(parts))
     
     def get_stats(self):
         """Show statistics about deals"""
@@ -166,15 +422,14 @@ class DealTracker:
             print("📊 No deals to analyze yet")
             return
         
-        purchased_deals = [d for d in self.deals if d['purchased']]
-        active_deals = [d for d in self.deals if not d['purchased']]
+        purchased_deals = self._get_purchased()
+        active_deals = self._get_active()
         
-        total_saved = sum(deal['total_savings'] for deal in purchased_deals)
-        potential_savings = sum(deal['total_savings'] for deal in active_deals)
-        avg_savings = sum(deal['total_savings'] for deal in self.deals) / len(self.deals)
+        total_saved, potential_savings = self._get_totals()
+        avg_savings = (total_saved + potential_savings) / len(self.deals)
         
-        best_deal = max(self.deals, key=lambda x: x['total_savings'])
-        best_percent = max(self.deals, key=lambda x: x['savings_percent'])
+        best_deal = self._best_deal
+        best_percent = self._best_percent
         
         print(f"\n📊 Deal Statistics")
         print("=" * 40)
@@ -184,8 +439,8 @@ class DealTracker:
         print(f"Money already saved: ${total_saved:.2f}")
         print(f"Potential savings: ${potential_savings:.2f}")
         print(f"Average savings per deal: ${avg_savings:.2f}")
-        print(f"\n🏆 Best dollar savings: {best_deal['product']} (${best_deal['total_savings']:.2f})")
-        print(f"🏆 Best percentage savings: {best_percent['product']} ({best_percent['savings_percent']}%)")
+        print(f"\n🏆 Best dollar savings: {best_deal.product} (${best_deal.total_savings:.2f})")
+        print(f"🏆 Best percentage savings: {best_percent.product} ({best_percent.savings_percent:.1f}%)")
 
 def main():
     """Main interactive menu"""
@@ -199,35 +454,33 @@ def main():
         print("✨ Use option 1 below to add deals as you find them\n")
     
     while True:
-        print(f"\n🛍️  Giant Food Deal Tracker")
-        print("=" * 40)
-        print("1. 📱 Add new deal")
-        print("2. 👀 Show active deals")
-        print("3. 📋 Show all deals")
-        print("4. ✅ Mark deal as purchased")
-        print("5. 📝 Generate shopping list")
-        print("6. 📊 Show statistics")
-        print("7. 🚪 Exit")
+        sys.stdout.write(MENU)
         
         choice = input("\nWhat would you like to do? (1-7): ").strip()
         
         if choice == '1':
-            print("\n📱 Add New Deal")
-            print("-" * 20)
-            try:
-                product = input("Product name: ").strip()
-                original = float(input("Original price ($): "))
-                sale = float(input("Sale price ($): "))
-                coupon = float(input("Digital coupon discount ($): "))
-                store = input("Store location (optional): ").strip()
-                notes = input("Notes (optional): ").strip()
-                
-                tracker.add_deal(product, original, sale, coupon, store, notes)
-            except ValueError:
-                print("❌ Please enter valid numbers for prices")
+            # Save once after the whole session rather than after every deal
+            with tracker:
+                while True:
+                    print("\n📱 Add New Deal")
+                    print("-" * 20)
+                    try:
+                        product = input("Product name: ").strip()
+                        original = float(input("Original price ($): "))
+                        sale = float(input("Sale price ($): "))
+                        coupon = float(input("Digital coupon discount ($): "))
+                        store = input("Store location (optional): ").strip()
+                        notes = input("Notes (optional): ").strip()
+                        
+                        tracker.add_deal(product, original, sale, coupon, store, notes)
+                    except ValueError:
+                        print("❌ Please enter valid numbers for prices")
+                    
+                    if input("\nAdd another deal? (y/N): ").strip().lower() != 'y':
+                        break
         
         elif choice == '2':
-            tracker.show_active_deals()
+            tracker.show_active_deals(limit=_TOP_DEALS)
         
         elif choice == '3':
             tracker.show_all_deals()